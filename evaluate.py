@@ -2,26 +2,69 @@
 
 import os
 import argparse
+import asyncio
+import csv
+import functools
 import logging
 import re
-import pandas as pd
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Awaitable, Callable, Iterator
 
+import httpx
 from langchain_core.messages import HumanMessage
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
+from openai import APIConnectionError, APIStatusError
 
 from epam.auto_llm_eval import (
-    evaluate_scenario,
+    aevaluate_scenario,
+    aevaluate_scenarios_batch,
     grade_scenario,
+    hash_prompt,
     read_file,
+    validate_evaluation_report,
     write_file,
     Criteria,
+    LLMCache,
+    RateLimitedRunnable,
 )
 
 logger = logging.getLogger(__name__)
 
+# Errors that may be transient, checked by is_retryable_error. Timeouts are
+# a subclass of connection errors.
+RETRYABLE_ERRORS = (APIStatusError, APIConnectionError)
 
-def get_gpt4_model():
+# Same status codes as the OpenAI client retries: request timeout, lock
+# conflict, rate limit and server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check if a failed LLM request should be retried with backoff."""
+    if isinstance(error, APIStatusError):
+        return (
+            error.status_code in RETRYABLE_STATUS_CODES
+            or error.status_code >= 500
+        )
+
+    return True
+
+
+def get_http_async_client(max_connections: int) -> httpx.AsyncClient:
+    """Get an HTTP client keeping connections alive between requests."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        # Same limits as the OpenAI client defaults, reasoning models can
+        # take minutes to respond
+        timeout=httpx.Timeout(600.0, connect=5.0),
+    )
+
+
+def get_gpt4_model(http_async_client: httpx.AsyncClient | None = None):
     """Get the GPT-4 model."""
     # Specify configuration for the AI Dial endpoint
     openai_endpoint = "https://ai-proxy.lab.epam.com"
@@ -40,12 +83,16 @@ def get_gpt4_model():
         azure_deployment=openai_deploymet_name,
         api_version=openai_api_version,
         api_key=azure_api_key,
+        http_async_client=http_async_client,
+        # Retries are done by RateLimitedRunnable, which backs off outside
+        # of the concurrency limit
+        max_retries=0,
     )
 
     return model
 
 
-def get_o3_mini_model():
+def get_o3_mini_model(http_async_client: httpx.AsyncClient | None = None):
     """Get the o1-mini model for generating evaluation reports."""
     # Read API key from the environment variables
     openai_api_key = os.environ["OPENAI_API_KEY"]
@@ -57,24 +104,121 @@ def get_o3_mini_model():
         model_name="o3-mini",
         temperature=1,
         api_key=openai_api_key,
+        http_async_client=http_async_client,
+        # Retries are done by RateLimitedRunnable, which backs off outside
+        # of the concurrency limit
+        max_retries=0,
     )
 
     return model
 
 
-def save_grading_report(report_path: str, report):
-    """Save the grading report to a file."""
-    df = pd.DataFrame(report)
-    df.to_csv(report_path, index=False)
+def get_model_id(model) -> str:
+    """Get the model identifier used in the LLM cache keys."""
+    parts = [
+        model.model_name,
+        getattr(model, "deployment_name", None),
+        getattr(model, "openai_api_version", None),
+    ]
+
+    return "|".join(str(part) for part in parts if part)
+
+
+def extract_json_from_md(content: str) -> str:
+    """Extract the JSON document from a Markdown code block, if any."""
+    content = content.strip()
+    # Only a code block wrapping the whole response is unwrapped. Fences
+    # inside the JSON document, e.g. code quoted in an explanation, are part
+    # of the document.
+    fenced = content.startswith("```") and content.endswith("```")
+    if fenced and len(content) >= 6:
+        return content[3:-3].removeprefix("json").strip()
+
+    return content
+
+
+async def invoke_model(model, prompt: str) -> str:
+    """Send the prompt to the model and return the response text."""
+    message: HumanMessage = HumanMessage(content=prompt)
+    api_response = await model.ainvoke([message])
+
+    return str(api_response.content)
+
+
+def validate_reply(reply: str, answers: int = 1) -> None:
+    """Check that the LLM reply contains the evaluation report to grade.
+
+    Args:
+        reply: Reply of the LLM
+        answers: Number of answers evaluated by the prompt, a batch reply
+            must contain one report per answer
+
+    Raises:
+        TypeError: If the report is in wrong format.
+    """
+    validate_evaluation_report(extract_json_from_md(reply), answers)
+
+
+async def execute_cached_prompt(
+    model, model_id: str, cache: LLMCache, prompt: str, answers: int = 1
+) -> str:
+    """Execute the prompt through the cache and extract the JSON report.
+
+    Only replies containing a valid report for the given number of answers
+    are cached, so a refused or malformed reply is requested again on the
+    next run.
+    """
+    report: str = await cache.get_or_call(
+        hash_prompt(model_id, prompt),
+        functools.partial(invoke_model, model, prompt),
+        functools.partial(validate_reply, answers=answers),
+    )
+
+    return extract_json_from_md(report)
+
+
+GRADING_REPORT_FIELDS = ["scenario_id", "accuracy_score", "completeness_score"]
+
+# Grading report row with the values of GRADING_REPORT_FIELDS, in order
+GradingRow = tuple[int, float, float]
+
+
+@contextmanager
+def open_grading_report(
+    report_path: str,
+) -> Iterator[Callable[[GradingRow], None]]:
+    """Open the grading report and yield a function writing a single row.
+
+    Every row is flushed right away, so the report keeps the graded
+    scenarios even if the run is interrupted.
+    """
+    with open(report_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(GRADING_REPORT_FIELDS)
+
+        def write_row(row: GradingRow) -> None:
+            writer.writerow(row)
+            f.flush()
+
+        yield write_row
+
+
+SCENARIO_RANGES_PATTERN = re.compile(
+    r"\s*\d+\s*(?:-\s*\d+\s*)?(?:,\s*\d+\s*(?:-\s*\d+\s*)?)*"
+)
+SCENARIO_RANGE_PATTERN = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
 
 
-def parse_scenarios_ranges(scenarios_ranges: str):
-    """Parse scenarios ranges. Sample: 1,3,5-10"""
+def parse_scenarios_ranges(scenarios_ranges: str) -> set[int]:
+    """Parse scenarios ranges into a set of numbers. Sample: 1,3,5-10"""
+    if not SCENARIO_RANGES_PATTERN.fullmatch(scenarios_ranges):
+        raise ValueError(f"Invalid scenario ranges: {scenarios_ranges}")
+
     result = set()
-    for part in scenarios_ranges.split(","):
-        x = part.split("-")
-        result.update(range(int(x[0]), int(x[-1]) + 1))
-    return sorted(result)
+    for match in SCENARIO_RANGE_PATTERN.finditer(scenarios_ranges):
+        result.update(range(int(match[1]), int(match[2] or match[1]) + 1))
+
+    return result
 
 
 def validate_data_path(path: str) -> str:
@@ -122,40 +266,65 @@ def validate_report_path(path: str) -> str:
     return abs_path
 
 
-def is_valid_scenario(
-    scenario_dir: str, data_dir: str, scenarios: list[int]
-) -> bool:
-    """Check if the given scenario_dir represents a valid scenario to evaluate.
+def validate_cache_path(path: str) -> str:
+    """Validate and normalize an LLM cache file path."""
+    if not path:
+        raise ValueError("Cache path cannot be empty")
+
+    # Convert to absolute path and normalize separators
+    abs_path = os.path.abspath(os.path.expanduser(path))
+
+    # Check if the parent directory exists
+    parent_dir = os.path.dirname(abs_path)
+    if not os.path.exists(parent_dir):
+        raise FileNotFoundError(
+            f"Parent directory for LLM cache does not exist: {parent_dir}"
+        )
+
+    # Check if path is not a directory
+    if os.path.isdir(abs_path):
+        raise ValueError(f"Cache path is a directory: {abs_path}")
+
+    return abs_path
+
+
+def is_valid_scenario(entry: os.DirEntry, scenarios: set[int]) -> bool:
+    """Check if the given entry represents a valid scenario to evaluate.
 
     Args:
-        scenario_dir: Name of the directory to check
-        data_dir: Base directory path
-        scenarios: List of scenario numbers to evaluate
+        entry: Entry of the data directory to check
+        scenarios: Set of scenario numbers to evaluate
 
     Returns:
         bool: True if the directory is a valid scenario to evaluate
     """
-    # Check if it's a directory
-    scenario_dir_full_path = os.path.join(data_dir, scenario_dir)
-    if not os.path.isdir(scenario_dir_full_path):
-        return False
-
+    # Check the name first, it needs no system calls
     # Check if scenario name is a number
-    if not scenario_dir.isdigit():
+    if not entry.name.isdigit():
         return False
 
     # Check if scenario number is in the requested range
-    if int(scenario_dir) not in scenarios:
+    if int(entry.name) not in scenarios:
+        return False
+
+    # Check if it's a directory
+    if not entry.is_dir():
         return False
 
     # Check required files present in the scenario directory
+    with os.scandir(entry.path) as scenario_entries:
+        scenario_files = {
+            scenario_entry.name
+            for scenario_entry in scenario_entries
+            if scenario_entry.is_file()
+        }
+
     required_files = ["input.txt", "meta.yaml", "output.md"]
     for required_file in required_files:
-        file_path = os.path.join(scenario_dir_full_path, required_file)
-        if not os.path.isfile(file_path):
+        if required_file not in scenario_files:
             logger.warning(
                 "Scenario %s is missing required file: %s",
-                scenario_dir,
+                entry.name,
                 required_file,
             )
             return False
@@ -163,6 +332,293 @@ def is_valid_scenario(
     return True
 
 
+async def load_scenario(scenario_path: Path) -> tuple[Criteria, str]:
+    """Read the criteria and the output of a scenario.
+
+    Both files are read concurrently in worker threads, so the reads do not
+    block the event loop while other scenarios wait for the LLM. The parsed
+    criteria are cached next to meta.yaml, see Criteria.from_yaml_file.
+
+    Args:
+        scenario_path: Path to the scenario directory
+
+    Returns:
+        tuple[Criteria, str]: Evaluation criteria and the scenario output
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(
+            Criteria.from_yaml_file, scenario_path / "meta.yaml"
+        ),
+        asyncio.to_thread(read_file, scenario_path / "output.md"),
+    )
+
+
+async def save_and_grade_scenario(
+    scenario_path: Path,
+    accuracy_report: str,
+    completeness_report: str,
+) -> GradingRow:
+    """Save the evaluation reports of a scenario and grade them.
+
+    The reports are written in worker threads while they are graded. They
+    are saved even if grading fails, which helps to inspect invalid reports.
+
+    Args:
+        scenario_path: Path to the scenario directory
+        accuracy_report: Accuracy evaluation report
+        completeness_report: Completeness evaluation report
+
+    Returns:
+        GradingRow: Grading report row for the scenario
+    """
+    writes = asyncio.gather(
+        asyncio.to_thread(
+            write_file, scenario_path / "accuracy.md", accuracy_report
+        ),
+        asyncio.to_thread(
+            write_file, scenario_path / "completeness.md", completeness_report
+        ),
+    )
+
+    try:
+        return grade_reports(
+            scenario_path, accuracy_report, completeness_report
+        )
+    finally:
+        await writes
+
+
+def grade_reports(
+    scenario_path: Path,
+    accuracy_report: str,
+    completeness_report: str,
+) -> GradingRow:
+    """Grade the evaluation reports of a scenario.
+
+    Args:
+        scenario_path: Path to the scenario directory
+        accuracy_report: Accuracy evaluation report
+        completeness_report: Completeness evaluation report
+
+    Returns:
+        GradingRow: Grading report row for the scenario
+    """
+    (accuracy_grade, completeness_grade) = grade_scenario(
+        accuracy_report=accuracy_report,
+        completeness_report=completeness_report,
+    )
+
+    return (
+        int(scenario_path.name),
+        accuracy_grade.get_score(),
+        completeness_grade.get_score(),
+    )
+
+
+EVALUATION_REPORT_FILES = ["accuracy.md", "completeness.md"]
+SCENARIO_SOURCE_FILES = ["meta.yaml", "output.md"]
+
+
+def has_evaluation_reports(scenario_path: Path) -> bool:
+    """Check if the scenario already has up-to-date evaluation reports.
+
+    The reports are up to date if they are not empty and are newer than
+    the criteria and the output they were produced from.
+
+    Args:
+        scenario_path: Path to the scenario directory
+
+    Returns:
+        bool: True if the reports can be graded without evaluation
+    """
+    try:
+        reports = [
+            (scenario_path / name).stat() for name in EVALUATION_REPORT_FILES
+        ]
+        sources = [
+            (scenario_path / name).stat() for name in SCENARIO_SOURCE_FILES
+        ]
+    except FileNotFoundError:
+        return False
+
+    return min(report.st_mtime_ns for report in reports) >= max(
+        source.st_mtime_ns for source in sources
+    ) and all(report.st_size > 0 for report in reports)
+
+
+async def grade_saved_scenario(scenario_path: Path) -> GradingRow | None:
+    """Grade the saved evaluation reports of a scenario.
+
+    Args:
+        scenario_path: Path to the scenario directory
+
+    Returns:
+        GradingRow | None: Grading report row for the scenario, or None if
+            the saved reports cannot be graded
+    """
+    (accuracy_report, completeness_report) = await asyncio.gather(
+        *(
+            asyncio.to_thread(read_file, scenario_path / name)
+            for name in EVALUATION_REPORT_FILES
+        )
+    )
+
+    try:
+        return grade_reports(
+            scenario_path, accuracy_report, completeness_report
+        )
+    except TypeError as e:
+        # Reports are saved even if grading fails, evaluate such scenarios
+        # again instead of failing on them on every run
+        logger.warning(
+            "Scenario %s has invalid evaluation reports: %s",
+            scenario_path.name,
+            e,
+        )
+        return None
+
+
+async def process_scenario_batch(
+    scenario_paths: list[Path],
+    execute_prompt: Callable[..., Awaitable[str]],
+    write_row: Callable[[GradingRow], None],
+    semaphore: asyncio.Semaphore,
+) -> list[int]:
+    """Evaluate and grade a batch of scenarios.
+
+    A single scenario is evaluated with the regular prompts, several
+    scenarios are evaluated together with one prompt per metric.
+
+    Args:
+        scenario_paths: Paths to the scenario directories in the batch
+        execute_prompt: Coroutine function to execute the evaluation prompt.
+            Batch prompts are executed with the number of scenarios in the
+            answers keyword argument.
+        write_row: Function writing a row to the grading report
+        semaphore: Semaphore limiting the number of concurrent batches
+
+    Returns:
+        list[int]: Identifiers of the graded scenarios
+    """
+    async with semaphore:
+        scenarios = await asyncio.gather(
+            *(load_scenario(scenario_path) for scenario_path in scenario_paths)
+        )
+
+        if len(scenarios) == 1:
+            (criteria, output) = scenarios[0]
+            reports = [
+                await aevaluate_scenario(
+                    criteria=criteria,
+                    output=output,
+                    execute_prompt=execute_prompt,
+                )
+            ]
+        else:
+            reports = await aevaluate_scenarios_batch(
+                scenarios=scenarios,
+                execute_prompt=functools.partial(
+                    execute_prompt, answers=len(scenarios)
+                ),
+            )
+
+    rows = await asyncio.gather(
+        *(
+            save_and_grade_scenario(
+                scenario_path, accuracy_report, completeness_report
+            )
+            for (scenario_path, (accuracy_report, completeness_report)) in zip(
+                scenario_paths, reports
+            )
+        )
+    )
+
+    for row in rows:
+        write_row(row)
+
+    return [row[0] for row in rows]
+
+
+async def process_scenarios(
+    scenario_paths: list[Path],
+    execute_prompt: Callable[..., Awaitable[str]],
+    write_row: Callable[[GradingRow], None],
+    max_concurrency: int,
+    batch_size: int,
+    force: bool = False,
+) -> list[int]:
+    """Evaluate and grade scenarios concurrently.
+
+    Scenarios with up-to-date evaluation reports from a previous run are
+    graded without evaluating them again, unless force is set. Scenarios
+    whose saved reports cannot be graded are evaluated again.
+
+    Args:
+        scenario_paths: Paths to the scenario directories
+        execute_prompt: Coroutine function to execute the evaluation prompt,
+            see process_scenario_batch
+        write_row: Function writing a row to the grading report
+        max_concurrency: Maximum number of batches evaluated at once. Each
+            batch has at least one request in flight, so more batches than
+            concurrent requests would only hold more files in memory.
+        batch_size: Number of scenarios evaluated with a single prompt
+        force: Evaluate all scenarios, even if they have evaluation reports.
+            Pass an execute_prompt bypassing the LLM cache as well, or the
+            cached replies are graded again.
+
+    Returns:
+        list[int]: Identifiers of the graded scenarios
+    """
+    graded = []
+    if not force:
+        saved_paths = []
+        pending_paths = []
+        for scenario_path in scenario_paths:
+            if has_evaluation_reports(scenario_path):
+                saved_paths.append(scenario_path)
+            else:
+                pending_paths.append(scenario_path)
+
+        if saved_paths:
+            logger.info(
+                "Grading %d scenario(s) with existing evaluation reports",
+                len(saved_paths),
+            )
+
+        # Saved reports are graded first, so the scenarios with invalid
+        # reports are evaluated together with the pending ones
+        rows = await asyncio.gather(
+            *(
+                grade_saved_scenario(scenario_path)
+                for scenario_path in saved_paths
+            )
+        )
+        for scenario_path, row in zip(saved_paths, rows):
+            if row is None:
+                pending_paths.append(scenario_path)
+            else:
+                write_row(row)
+                graded.append(row[0])
+
+        scenario_paths = pending_paths
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    batches = await asyncio.gather(
+        *(
+            process_scenario_batch(
+                scenario_paths[i : i + batch_size],
+                execute_prompt,
+                write_row,
+                semaphore,
+            )
+            for i in range(0, len(scenario_paths), batch_size)
+        )
+    )
+
+    return graded + [scenario_id for batch in batches for scenario_id in batch]
+
+
 def main():
     """Main function to evaluate the scenarios."""
     parser = argparse.ArgumentParser(
@@ -186,6 +642,15 @@ def main():
         default=None,
     )
 
+    group.add_argument(
+        "--cache-path",
+        type=str,
+        required=False,
+        help="Path to the LLM response cache (default: "
+        "DATA_DIR/llm_cache.sqlite)",
+        default=None,
+    )
+
     group = parser.add_argument_group("scenarios")
 
     exclusive_group = group.add_mutually_exclusive_group(required=True)
@@ -202,87 +667,129 @@ def main():
         help="Range(s) of scenarios to evaluate. Sample: 1,3,5-10",
     )
 
-    args = parser.parse_args()
+    group = parser.add_argument_group("execution")
+
+    group.add_argument(
+        "--max-concurrency",
+        type=int,
+        required=False,
+        help="Maximum number of concurrent LLM requests",
+        default=10,
+    )
 
-    scenarios = list()
+    group.add_argument(
+        "--requests-per-minute",
+        type=float,
+        required=False,
+        help="Maximum number of LLM requests per minute",
+        default=None,
+    )
 
-    if args.scenarios:
-        scenarios = list(range(1, args.scenarios + 1))
-    else:
-        scenarios = parse_scenarios_ranges(args.scenario_ranges)
+    group.add_argument(
+        "--batch-size",
+        type=int,
+        required=False,
+        help="Number of scenarios evaluated with a single LLM request",
+        default=1,
+    )
+
+    group.add_argument(
+        "--force",
+        action="store_true",
+        help="Evaluate scenarios again even if they have evaluation reports, "
+        "bypassing the LLM cache",
+    )
+
+    group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Request the LLM again instead of reusing cached responses",
+    )
+
+    args = parser.parse_args()
+
+    scenarios = set()
 
     try:
+        if args.scenarios:
+            scenarios = set(range(1, args.scenarios + 1))
+        else:
+            scenarios = parse_scenarios_ranges(args.scenario_ranges)
+
         data_dir = validate_data_path(args.data_dir)
         if args.report_path:
             report_path = validate_report_path(args.report_path)
         else:
             report_path = os.path.join(data_dir, "grades.csv")
 
-    except (ValueError, FileNotFoundError, FileExistsError) as e:
-        logger.error("Error: %s", e)
-        return 1
-
-    eval_model = get_o3_mini_model()
-
-    grading_report = []
-    for scenario_dir in os.listdir(data_dir):
-        scenario_id = int(scenario_dir)
-        if is_valid_scenario(scenario_dir, data_dir, scenarios):
-            criteria_yaml = read_file(
-                Path(data_dir) / scenario_dir / "meta.yaml"
-            )
-            criteria = Criteria.from_yaml(criteria_yaml)
-            output = read_file(Path(data_dir) / scenario_dir / "output.md")
-
-            def extract_json_from_md(content: str) -> str:
-                json_text = content
-                json_text = json_text.strip("\n")
-                json_text = json_text.strip("`")
-                json_text = json_text.replace("json\n", "", 1)
-
-                return json_text
+        if args.cache_path:
+            cache_path = validate_cache_path(args.cache_path)
+        else:
+            cache_path = os.path.join(data_dir, "llm_cache.sqlite")
 
-            def execute_prompt(prompt: str) -> str:
-                message: HumanMessage = HumanMessage(content=prompt)
-                api_response = eval_model.invoke([message])
-                report: str = str(api_response.content)
+        if args.max_concurrency < 1:
+            raise ValueError("Maximum concurrency must be a positive number")
 
-                return extract_json_from_md(report)
+        if args.batch_size < 1:
+            raise ValueError("Batch size must be a positive number")
 
-            (accuracy_report, completeness_report) = evaluate_scenario(
-                criteria=criteria,
-                output=output,
-                execute_prompt=execute_prompt,
-            )
+        if args.requests_per_minute is not None and (
+            args.requests_per_minute <= 0
+        ):
+            raise ValueError("Requests per minute must be a positive number")
 
-            write_file(
-                os.path.join(data_dir, scenario_dir, "accuracy.md"),
-                accuracy_report,
-            )
-            write_file(
-                os.path.join(data_dir, scenario_dir, "completeness.md"),
-                completeness_report,
-            )
+    except (ValueError, FileNotFoundError, FileExistsError) as e:
+        logger.error("Error: %s", e)
+        return 1
 
-            (accuracy_grade, completeness_grade) = grade_scenario(
-                accuracy_report=accuracy_report,
-                completeness_report=completeness_report,
-            )
+    # Share one connection pool between all requests, sized to the number
+    # of concurrent requests, so every request reuses a warm connection
+    http_client = get_http_async_client(args.max_concurrency)
+    eval_model = get_o3_mini_model(http_client)
+    eval_model_id = get_model_id(eval_model)
+    if args.batch_size > 1:
+        # Batch reports are parsed as a whole, so request a JSON response
+        eval_model = eval_model.bind(response_format={"type": "json_object"})
+    eval_model = RateLimitedRunnable(
+        eval_model,
+        max_concurrency=args.max_concurrency,
+        requests_per_minute=args.requests_per_minute,
+        retry_on=RETRYABLE_ERRORS,
+        retry_if=is_retryable_error,
+    )
+    # Forced evaluation requests the LLM again, or it would only replay the
+    # cached replies of the saved reports
+    cache = LLMCache(cache_path, refresh=args.force or args.refresh_cache)
+    execute_prompt = functools.partial(
+        execute_cached_prompt, eval_model, eval_model_id, cache
+    )
 
-            grading_report.append(
-                {
-                    "scenario_id": scenario_id,
-                    "accuracy_score": accuracy_grade.get_score(),
-                    "completeness_score": completeness_grade.get_score(),
-                }
+    # data_dir is already absolute, so the entry paths need no normalization
+    with os.scandir(data_dir) as entries:
+        scenario_paths = [
+            Path(entry.path)
+            for entry in entries
+            if is_valid_scenario(entry, scenarios)
+        ]
+
+    async def run(write_row: Callable[[GradingRow], None]) -> list[int]:
+        async with http_client:
+            return await process_scenarios(
+                scenario_paths,
+                execute_prompt,
+                write_row,
+                args.max_concurrency,
+                args.batch_size,
+                args.force,
             )
 
-            scenarios.remove(scenario_id)
+    with cache, open_grading_report(report_path) as write_row:
+        graded_scenarios = asyncio.run(run(write_row))
 
-    save_grading_report(report_path, grading_report)
+    scenarios.difference_update(graded_scenarios)
 
     if len(scenarios) > 0:
-        logger.warning("Missed scenario(s): %s", scenarios)
+        logger.warning("Missed scenario(s): %s", sorted(scenarios))
 
 
 if __name__ == "__main__":
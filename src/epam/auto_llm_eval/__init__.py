@@ -12,10 +12,19 @@ from epam.auto_llm_eval.evaluator import (
     CriterionEvalStepProcessed,
 )
 from epam.auto_llm_eval.evaluator import evaluate_output
+from epam.auto_llm_eval.evaluator import aevaluate_output
+from epam.auto_llm_eval.evaluator import evaluate_outputs_batch
+from epam.auto_llm_eval.evaluator import aevaluate_outputs_batch
 from epam.auto_llm_eval.evaluator import evaluate_scenario
+from epam.auto_llm_eval.evaluator import aevaluate_scenario
+from epam.auto_llm_eval.evaluator import aevaluate_scenarios_batch
+from epam.auto_llm_eval.evaluator import grade_report
 from epam.auto_llm_eval.evaluator import grade_scenario
+from epam.auto_llm_eval.evaluator import validate_evaluation_report
 from epam.auto_llm_eval.evaluator import read_file
 from epam.auto_llm_eval.evaluator import write_file
+from epam.auto_llm_eval.llm_cache import LLMCache, hash_prompt
+from epam.auto_llm_eval.rate_limit import RateLimitedRunnable
 
 __all__ = [
     "GradingResult",
@@ -25,8 +34,18 @@ __all__ = [
     "CriterionEvalSteps",
     "CriterionEvalStepProcessed",
     "evaluate_scenario",
+    "aevaluate_scenario",
+    "aevaluate_scenarios_batch",
     "evaluate_output",
+    "aevaluate_output",
+    "evaluate_outputs_batch",
+    "aevaluate_outputs_batch",
+    "grade_report",
     "grade_scenario",
+    "validate_evaluation_report",
     "read_file",
     "write_file",
+    "LLMCache",
+    "hash_prompt",
+    "RateLimitedRunnable",
 ]
@@ -1,97 +1,143 @@
 """This module provides functionality for evaluating and grading LLM answers"""
 
+import asyncio
+import functools
+import hashlib
 import json
 import os
 import logging
-import yaml
-import textwrap
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, List, Self, Tuple
+from typing import Any, Awaitable, Callable, List, Self, Tuple
 
+try:
+    # Optional Rust-backed parser, several times faster than the json module.
+    # Its errors subclass json.JSONDecodeError.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-logger = logging.getLogger(__name__)
-
-EVALUATION_PROMPT = textwrap.dedent(
-    '''
-    Your task is to evaluate the answer according to the evaluation steps.
-    Evaluate only that the answer meets the evaluation steps, do not make
-    any assumptions about the task/experiment conditions or the missing
-    context/images (trust that everything was provided to the task executor).
-
-    Output must be a valid JSON document containing evaluation report.
-    Return only JSON starting with {{ and ending with }}.
-    Do not add any comments to JSON document.
-
-    Evaluation report contains list of evaluated steps.
-    Each step contains the following fields: criterion, weight, passed, confidence, explanation.
-    - criterion: The evaluation criterion text as provided in the input.
-    - weight: The weight of the criterion as provided in the input.
-    - passed: true if the answer meets the criterion, false otherwise.
-    - confidence: Your confidence level in the evaluation result as a percentage (0-100%).
-    - explanation: Explanation of the evaluation result, especially if confidence is less than 100%.
 
-    Here's an example of an answer and its evaluation response:
-
-    ANSWER:
-
-    ```python
-    def sum_integers(a, b):
-        """
-        Sum two integers and return the result.
-
-        Args:
-            a: The first integer.
-            b: The second integer.
+logger = logging.getLogger(__name__)
 
-        Returns the sum of the two input integers.
-        """
-        return a + b
-    ```
+# Shared by all evaluate_scenario calls, threads are started on first use
+_executor = ThreadPoolExecutor(thread_name_prefix="auto_llm_eval")
 
-    EVALUATION STEPS:
+# The static instructions and the example go first and are never formatted,
+# so every evaluation request starts with the same bytes and the provider can
+# reuse its cached prefix.
+EVALUATION_PROMPT_PREFIX = '''
+Your task is to evaluate the answer according to the evaluation steps.
+Evaluate only that the answer meets the evaluation steps, do not make
+any assumptions about the task/experiment conditions or the missing
+context/images (trust that everything was provided to the task executor).
 
-    - criterion: Verify the function code is written in Python
-      weight: 1.0
-    - criterion: Verify the function has a docstring
-      weight: 0.5
-    - Verify the function has type hints
-      weight: 0.5
-    - Ensure the code is elegant
-      weight: 0.25
+Output must be a valid JSON document containing evaluation report.
+Return only JSON starting with { and ending with }.
+Do not add any comments to JSON document.
 
-    EVALUATION REPORT:
-    {{
-      "evaluation_steps": [
-        {{"criterion": "Verify the function code is written in Python", "weight": 1.0, "passed": true, "confidence": 100, "explanation": "The function is clearly written in Python syntax."}},
-        {{"criterion": "Verify the function has a docstring", "weight": 0.5, "passed": true, "confidence": 100, "explanation": "The function includes a docstring that describes its purpose, arguments, and return value."}},
-        {{"criterion": "Verify the function has type hints", "weight": 0.5, "passed": false, "confidence": 100, "explanation": "The function does not include type hints for its parameters or return type."}},
-        {{"criterion": "Ensure the code is elegant", "weight": 0.25, "passed": true, "confidence": 90, "explanation": "The code is simple and straightforward, but could be improved with type hints."}}
-      ]
-    }}
+Evaluation report contains list of evaluated steps.
+Each step contains the following fields: criterion, weight, passed, confidence, explanation.
+- criterion: The evaluation criterion text as provided in the input.
+- weight: The weight of the criterion as provided in the input.
+- passed: true if the answer meets the criterion, false otherwise.
+- confidence: Your confidence level in the evaluation result as a percentage (0-100%).
+- explanation: Explanation of the evaluation result, especially if confidence is less than 100%.
 
-    Now, evaluate the following and provide the evaluation report in the specified JSON format:
+Here's an example of an answer and its evaluation response:
 
-    ANSWER:
+ANSWER:
 
-    {answer}
+```python
+def sum_integers(a, b):
+    """
+    Sum two integers and return the result.
 
-    EVALUATION STEPS:
+    Args:
+        a: The first integer.
+        b: The second integer.
 
-    {steps}
-    '''
+    Returns the sum of the two input integers.
+    """
+    return a + b
+```
+
+EVALUATION STEPS:
+
+- criterion: Verify the function code is written in Python
+  weight: 1.0
+- criterion: Verify the function has a docstring
+  weight: 0.5
+- Verify the function has type hints
+  weight: 0.5
+- Ensure the code is elegant
+  weight: 0.25
+
+EVALUATION REPORT:
+{
+  "evaluation_steps": [
+    {"criterion": "Verify the function code is written in Python", "weight": 1.0, "passed": true, "confidence": 100, "explanation": "The function is clearly written in Python syntax."},
+    {"criterion": "Verify the function has a docstring", "weight": 0.5, "passed": true, "confidence": 100, "explanation": "The function includes a docstring that describes its purpose, arguments, and return value."},
+    {"criterion": "Verify the function has type hints", "weight": 0.5, "passed": false, "confidence": 100, "explanation": "The function does not include type hints for its parameters or return type."},
+    {"criterion": "Ensure the code is elegant", "weight": 0.25, "passed": true, "confidence": 90, "explanation": "The code is simple and straightforward, but could be improved with type hints."}
+  ]
+}
+
+Now, evaluate the following and provide the evaluation report in the specified JSON format:
+'''
+
+EVALUATION_PROMPT_SUFFIX = '''
+ANSWER:
+
+{answer}
+
+EVALUATION STEPS:
+
+{steps}
+'''
+
+# Split the template once at import time, so building a prompt is a single
+# join instead of parsing the format string on every call.
+(_EVALUATION_PROMPT_HEAD, _, _EVALUATION_PROMPT_REST) = (
+    EVALUATION_PROMPT_SUFFIX.partition("{answer}")
+)
+_EVALUATION_PROMPT_HEAD = EVALUATION_PROMPT_PREFIX + _EVALUATION_PROMPT_HEAD
+(_EVALUATION_PROMPT_MID, _, _EVALUATION_PROMPT_TAIL) = (
+    _EVALUATION_PROMPT_REST.partition("{steps}")
 )
 
+# Batch prompts share the static prefix with single evaluation prompts, so
+# they benefit from the same provider-side prompt caching.
+BATCH_EVALUATION_PROMPT_SUFFIX = '''
+There are several numbered answers below, each followed by its own
+evaluation steps. Evaluate every answer only against its own evaluation
+steps. Return a single JSON document with the "reports" list containing
+one evaluation report per answer, in the order the answers are given:
+{"reports": [{"evaluation_steps": [...]}, {"evaluation_steps": [...]}]}
+'''
+
 
 class CriterionEvalStep:
+    # Steps are created for every criterion of every report, slots keep
+    # them small and make attribute access in the grading loop cheaper
+    __slots__ = ("criterion", "weight")
+
     criterion: str
     weight: float
 
     def __init__(self, criterion: str, weight: float):
+        # The same criteria appear in every report of a scenario, interning
+        # keeps a single copy of each text
+        if type(criterion) is str:
+            criterion = sys.intern(criterion)
         self.criterion = criterion
         self.weight = weight
 
 
 class CriterionEvalStepProcessed(CriterionEvalStep):
+    __slots__ = ("passed", "explanation")
+
     passed: bool
     explanation: str
 
@@ -104,6 +150,8 @@ class CriterionEvalStepProcessed(CriterionEvalStep):
 
 
 class CriterionEvalSteps:
+    __slots__ = ("accuracy", "completeness")
+
     accuracy: List[CriterionEvalStep]
     completeness: List[CriterionEvalStep]
 
@@ -117,6 +165,8 @@ class CriterionEvalSteps:
 
 
 class CriteriaMeta:
+    __slots__ = ("category", "experiment", "repository", "scenario_id")
+
     category: str
     experiment: str
     repository: str
@@ -131,6 +181,30 @@ class CriteriaMeta:
         self.scenario_id = scenario_id
 
 
+# YAML parsing function, set by _load_yaml on first use
+_yaml_load: Callable[[str], Any] | None = None
+
+
+def _load_yaml(yaml_content: str):
+    """Parse a YAML document, importing PyYAML on first use."""
+    global _yaml_load
+
+    if _yaml_load is None:
+        # PyYAML is only needed to load criteria, so importing it lazily
+        # keeps the import of this module cheap. The loader is chosen once.
+        import yaml
+
+        try:
+            # libyaml-backed loader, much faster than the pure-Python one
+            loader = yaml.CSafeLoader
+        except AttributeError:  # PyYAML built without libyaml
+            loader = yaml.SafeLoader
+
+        _yaml_load = functools.partial(yaml.load, Loader=loader)
+
+    return _yaml_load(yaml_content)
+
+
 class Criteria:
     evaluation_steps: CriterionEvalSteps
     metadata: CriteriaMeta
@@ -143,45 +217,111 @@ class Criteria:
 
     @staticmethod
     def from_yaml(yaml_content: str) -> Self:
-        data = yaml.safe_load(yaml_content)
+        return Criteria._from_data(_load_yaml(yaml_content))
+
+    @staticmethod
+    def from_yaml_file(file_path: str | Path) -> Self:
+        """
+        Load the criteria from a YAML file, caching the parsed data.
+
+        The parsed data is stored next to the file as a JSON sidecar
+        (`<file>.cache.json`) together with the SHA-256 hash of the file,
+        and reused while the hash matches, as JSON parses much faster than
+        YAML. The loaded criteria are also kept in memory until the file
+        changes, so repeated loads return the same instance, which must not
+        be modified.
 
+        Args:
+            file_path (str | Path): The path to the YAML file.
+
+        Returns:
+            Criteria: The loaded criteria.
+        """
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+
+        return Criteria._load_yaml_file(
+            file_path, stat.st_mtime_ns, stat.st_size
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _load_yaml_file(
+        file_path: str, yaml_mtime: int, yaml_size: int
+    ) -> Self:
+        # The modification time and the size are part of the key, so a
+        # changed file is loaded again
+        cache_path = f"{file_path}.cache.json"
+
+        yaml_content = read_file(file_path)
+        # The sidecar is checked against the content, as the modification
+        # time of a restored file (git checkout, cp -p, rsync) can be older
+        # than a stale sidecar
+        yaml_hash = hashlib.sha256(yaml_content.encode("utf-8")).hexdigest()
+
+        try:
+            cache = _json_loads(read_file(cache_path))
+            if cache["sha256"] == yaml_hash:
+                return Criteria._from_data(cache["data"])
+        except (OSError, ValueError, TypeError, KeyError):
+            # Missing, unreadable or corrupt sidecar, parse the YAML
+            pass
+
+        data = _load_yaml(yaml_content)
+        criteria = Criteria._from_data(data)
+
+        try:
+            write_file(
+                cache_path,
+                json.dumps(
+                    {"sha256": yaml_hash, "data": data}, ensure_ascii=False
+                ),
+            )
+        except (OSError, TypeError, ValueError) as e:
+            # Not every YAML value is JSON serializable, e.g. dates
+            logger.debug("Criteria of %s not cached: %s", file_path, e)
+
+        return criteria
+
+    @staticmethod
+    def _from_data(data: dict) -> Self:
         if "evaluation_steps" not in data or "metadata" not in data:
             raise ValueError(
                 "YAML must contain 'evaluation_steps' and 'metadata' sections."
             )
 
         eval_steps = data["evaluation_steps"]
-        accuracy_steps = []
-        completeness_steps = []
 
         if "accuracy" not in eval_steps or "completeness" not in eval_steps:
             raise ValueError(
                 "YAML 'evaluation_steps' must contain 'accuracy' and 'completeness'."
             )
 
-        for item in eval_steps["accuracy"]:
-            if "criterion" not in item or "weight" not in item:
-                raise ValueError(
-                    "Each accuracy step must have 'criterion' and 'weight'."
-                )
-
-            accuracy_steps.append(
+        # Missing keys are detected by the lookups, checking every item for
+        # them upfront would look each key up twice
+        try:
+            accuracy_steps = [
                 CriterionEvalStep(
                     criterion=item["criterion"], weight=float(item["weight"])
                 )
-            )
-
-        for item in eval_steps["completeness"]:
-            if "criterion" not in item or "weight" not in item:
-                raise ValueError(
-                    "Each completeness step must have 'criterion' and 'weight'."
-                )
+                for item in eval_steps["accuracy"]
+            ]
+        except (KeyError, TypeError):
+            raise ValueError(
+                "Each accuracy step must have 'criterion' and 'weight'."
+            ) from None
 
-            completeness_steps.append(
+        try:
+            completeness_steps = [
                 CriterionEvalStep(
                     criterion=item["criterion"], weight=float(item["weight"])
                 )
-            )
+                for item in eval_steps["completeness"]
+            ]
+        except (KeyError, TypeError):
+            raise ValueError(
+                "Each completeness step must have 'criterion' and 'weight'."
+            ) from None
 
         steps = CriterionEvalSteps(
             accuracy=accuracy_steps, completeness=completeness_steps
@@ -234,17 +374,25 @@ class GradingResult:
         Returns:
             float: The overall score as a float between 0 and 1.
         """
-        total_weight = sum(c.weight for c in self.evaluation_steps)
+        # Accumulate both sums in a single pass over the steps
+        total_weight = passed_weight = 0.0
+        for c in self.evaluation_steps:
+            weight = c.weight
+            total_weight += weight
+            if c.passed:
+                passed_weight += weight
+
         if total_weight == 0:
             return 0.0
-        passed_weight = sum(
-            c.weight for c in self.evaluation_steps if c.passed
-        )
         score = passed_weight / total_weight
 
         return score
 
 
+# Files below this size are read with a single system call
+_READ_FILE_FAST_PATH_LIMIT = 4 * 1024 * 1024
+
+
 def read_file(file_path: str | Path) -> str:
     """
     Read the content of a file and return it as a string.
@@ -263,8 +411,32 @@ def read_file(file_path: str | Path) -> str:
         FileNotFoundError: If the specified file does not exist.
         IOError: If there's an error reading the file.
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # O_BINARY keeps Windows from translating newlines and stopping at ^Z,
+    # newlines are translated below as the text mode does
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        # Pseudo-files, e.g. in /proc, report a size of 0, read them until EOF
+        if size == 0 or size >= _READ_FILE_FAST_PATH_LIMIT:
+            with open(fd, "r", encoding="utf-8", closefd=False) as f:
+                return f.read()
+
+        # Small files are read with raw syscalls, skipping the buffered text
+        # layer. A regular file is read in one call, the loop only guards
+        # against short reads. The file is read up to the size it had when
+        # it was opened.
+        chunks = []
+        remaining = size
+        while remaining > 0 and (chunk := os.read(fd, remaining)):
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+
+    content = b"".join(chunks).decode("utf-8")
+    if "\r" in content:
+        # Translate newlines as the text mode does
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
     return content
 
 
@@ -273,8 +445,8 @@ def write_file(file_path: str | Path, content: str) -> None:
     Write the content to a file.
 
     This function opens the specified file in write mode and writes the given
-    content to it. It first converts the file path to absolute and checks that
-    the parent directory exists.
+    content to it. It first converts the file path to absolute, a missing
+    parent directory is reported when the file cannot be created.
 
     It uses UTF-8 encoding to handle various character sets.
 
@@ -287,15 +459,20 @@ def write_file(file_path: str | Path, content: str) -> None:
         IOError: If there's an error writing to the file.
         FileNotFoundError: If the parent directory does not exist.
     """
-    abs_path = os.path.abspath(os.path.expanduser(file_path))
-    parent_dir = os.path.dirname(abs_path)
+    file_path = os.fspath(file_path)
+    if file_path.startswith("~"):
+        file_path = os.path.expanduser(file_path)
+    abs_path = os.path.abspath(file_path)
 
-    if not os.path.exists(parent_dir):
+    try:
+        f = open(abs_path, "w", encoding="utf-8")
+    except FileNotFoundError as e:
+        parent_dir = os.path.dirname(abs_path)
         raise FileNotFoundError(
             f"Parent directory does not exist: {parent_dir}"
-        )
+        ) from e
 
-    with open(abs_path, "w", encoding="utf-8") as f:
+    with f:
         f.write(content)
 
 
@@ -323,22 +500,207 @@ def evaluate_output(
       ValueError: If the evaluation_steps list is empty.
       TypeError: If evaluate is not callable.
     """
+    if not callable(execute_prompt):
+        raise TypeError(
+            "evaluate must be a callable accepting a string and returning a string."
+        )
+
+    prompt: str = _build_evaluation_prompt(evaluation_steps, output)
+    report: str = execute_prompt(prompt)
+
+    return report
+
+
+async def aevaluate_output(
+    evaluation_steps: List[CriterionEvalStep],
+    output: str,
+    execute_prompt: Callable[[str], Awaitable[str]],
+) -> str:
+    """
+    Evaluate the answer based on the provided evaluation steps asynchronously.
+
+    This is the asynchronous counterpart of `evaluate_output`. It lets the
+    caller run several evaluations concurrently while waiting for the LLM.
+
+    Args:
+      evaluation_steps (List[EvalStep]): A list of steps to be used in evaluating
+      the output.
+      output (str): The output to be evaluated.
+      execute_prompt (callable): A coroutine function that accepts a string prompt and returns a string report.
+
+    Returns:
+      str: The evaluation report generated by the evaluation function.
+
+    Raises:
+      ValueError: If the evaluation_steps list is empty.
+      TypeError: If evaluate is not callable.
+    """
+    if not callable(execute_prompt):
+        raise TypeError(
+            "evaluate must be a coroutine function accepting a string and returning a string."
+        )
+
+    prompt: str = _build_evaluation_prompt(evaluation_steps, output)
+    report: str = await execute_prompt(prompt)
+
+    return report
+
+
+def _build_evaluation_prompt(
+    evaluation_steps: List[CriterionEvalStep], output: str
+) -> str:
+    """
+    Build the evaluation prompt for the given evaluation steps and answer.
+
+    Raises:
+      ValueError: If the evaluation_steps list is empty.
+    """
     if not evaluation_steps:
         raise ValueError("Evaluation steps cannot be empty.")
+
+    return "".join(
+        (
+            _EVALUATION_PROMPT_HEAD,
+            output,
+            _EVALUATION_PROMPT_MID,
+            *_format_evaluation_steps(evaluation_steps),
+            _EVALUATION_PROMPT_TAIL,
+        )
+    )
+
+
+def _format_evaluation_steps(
+    evaluation_steps: List[CriterionEvalStep],
+) -> List[str]:
+    """Format the evaluation steps as YAML list items for the prompt."""
+    # A list comprehension unpacks into the prompt join faster than a
+    # generator, and f-strings beat both % formatting and concatenation
+    return [
+        f"- criterion: {item.criterion}\n  weight: {item.weight}\n"
+        for item in evaluation_steps
+    ]
+
+
+def evaluate_outputs_batch(
+    items: List[Tuple[List[CriterionEvalStep], str]],
+    execute_prompt: Callable[[str], str],
+) -> List[str]:
+    """
+    Evaluate several answers with a single prompt.
+
+    Packing several answers into one request reduces the number of
+    requests sent to the LLM, which helps when the endpoint limits the
+    number of requests per minute.
+
+    Args:
+      items (List[Tuple[List[EvalStep], str]]): Pairs of evaluation steps and
+      the output to be evaluated against them.
+      execute_prompt (callable): A function that accepts a string prompt and returns a string report.
+
+    Returns:
+      List[str]: The evaluation reports, one per item, in the same order.
+
+    Raises:
+      ValueError: If items or any evaluation_steps list is empty.
+      TypeError: If evaluate is not callable or the batch report is in wrong
+      format.
+    """
     if not callable(execute_prompt):
         raise TypeError(
             "evaluate must be a callable accepting a string and returning a string."
         )
+    if len(items) == 1:
+        (evaluation_steps, output) = items[0]
+        return [evaluate_output(evaluation_steps, output, execute_prompt)]
 
-    criterion_str = ""
-    for item in evaluation_steps:
-        criterion_str += (
-            f"- criterion: {item.criterion}\n  weight: {item.weight}\n"
-        )
-    prompt: str = EVALUATION_PROMPT.format(answer=output, steps=criterion_str)
+    prompt: str = _build_batch_evaluation_prompt(items)
     report: str = execute_prompt(prompt)
 
-    return report
+    return _split_batch_evaluation_report(report, len(items))
+
+
+async def aevaluate_outputs_batch(
+    items: List[Tuple[List[CriterionEvalStep], str]],
+    execute_prompt: Callable[[str], Awaitable[str]],
+) -> List[str]:
+    """
+    Evaluate several answers with a single prompt asynchronously.
+
+    This is the asynchronous counterpart of `evaluate_outputs_batch`.
+
+    Args:
+      items (List[Tuple[List[EvalStep], str]]): Pairs of evaluation steps and
+      the output to be evaluated against them.
+      execute_prompt (callable): A coroutine function that accepts a string prompt and returns a string report.
+
+    Returns:
+      List[str]: The evaluation reports, one per item, in the same order.
+
+    Raises:
+      ValueError: If items or any evaluation_steps list is empty.
+      TypeError: If evaluate is not callable or the batch report is in wrong
+      format.
+    """
+    if not callable(execute_prompt):
+        raise TypeError(
+            "evaluate must be a coroutine function accepting a string and returning a string."
+        )
+    if len(items) == 1:
+        (evaluation_steps, output) = items[0]
+        return [
+            await aevaluate_output(evaluation_steps, output, execute_prompt)
+        ]
+
+    prompt: str = _build_batch_evaluation_prompt(items)
+    report: str = await execute_prompt(prompt)
+
+    return _split_batch_evaluation_report(report, len(items))
+
+
+def _build_batch_evaluation_prompt(
+    items: List[Tuple[List[CriterionEvalStep], str]],
+) -> str:
+    """
+    Build the evaluation prompt for several answers.
+
+    Raises:
+      ValueError: If items or any evaluation_steps list is empty.
+    """
+    if not items:
+        raise ValueError("Batch items cannot be empty.")
+
+    parts = [EVALUATION_PROMPT_PREFIX, BATCH_EVALUATION_PROMPT_SUFFIX]
+    for number, (evaluation_steps, output) in enumerate(items, 1):
+        if not evaluation_steps:
+            raise ValueError("Evaluation steps cannot be empty.")
+
+        parts.append(f"\nANSWER {number}:\n\n")
+        parts.append(output)
+        parts.append(f"\n\nEVALUATION STEPS {number}:\n\n")
+        parts.extend(_format_evaluation_steps(evaluation_steps))
+
+    return "".join(parts)
+
+
+def _split_batch_evaluation_report(report: str, count: int) -> List[str]:
+    """
+    Split the batch evaluation report into per-answer evaluation reports.
+
+    Raises:
+        TypeError: If the batch report is in wrong format or does not
+        contain exactly one report per answer.
+    """
+    try:
+        reports = _json_loads(report)["reports"]
+    except (json.JSONDecodeError, TypeError, KeyError) as e:
+        raise TypeError(f"Invalid batch evaluation report: {e}")
+
+    if not isinstance(reports, list) or len(reports) != count:
+        raise TypeError(
+            f"Invalid batch evaluation report: expected {count} reports"
+        )
+
+    return [json.dumps(item, indent=2, ensure_ascii=False) for item in reports]
 
 
 def grade_report(evaluation_report: str) -> GradingResult:
@@ -357,12 +719,22 @@ def grade_report(evaluation_report: str) -> GradingResult:
 
     result = GradingResult()
     try:
-        report_json = json.loads(evaluation_report)
+        report_json = _json_loads(evaluation_report)
         evaluation_steps = report_json.get("evaluation_steps")
+        # Append to the list directly, skipping a method call per step
+        add_eval_step = result.evaluation_steps.append
         for item in evaluation_steps:
+            # Fields are read with dict.get, not operator.itemgetter, as any
+            # of them may be missing: the sample reports use "criteria"
+            # instead of "criterion". A missing weight still fails below.
             criterion = item.get("criterion")
-            weight = float(item.get("weight"))
-            passed = bool(item.get("passed"))
+            # JSON numbers and booleans usually have the right type already
+            weight = item.get("weight")
+            if type(weight) is not float:
+                weight = float(weight)
+            passed = item.get("passed")
+            if type(passed) is not bool:
+                passed = bool(passed)
             explanation = item.get("explanation")
             eval_step_obj = CriterionEvalStepProcessed(
                 criterion=criterion,
@@ -370,44 +742,172 @@ def grade_report(evaluation_report: str) -> GradingResult:
                 passed=passed,
                 explanation=explanation,
             )
-            result.add_eval_step(eval_step_obj)
+            add_eval_step(eval_step_obj)
     except (json.JSONDecodeError, TypeError, ValueError, AttributeError) as e:
         raise TypeError(f"Invalid evaluation report: {e}")
 
     return result
 
 
+def validate_evaluation_report(
+    evaluation_report: str, count: int = 1
+) -> None:
+    """
+    Check that the evaluation report of a prompt can be graded.
+
+    A prompt with a single answer must return a single evaluation report, a
+    batch prompt must return one report per answer, see
+    `evaluate_outputs_batch`.
+
+    Args:
+        evaluation_report (str): The evaluation report to be checked.
+        count (int): The number of answers evaluated by the prompt.
+
+    Raises:
+        TypeError: If the evaluation report is in wrong format.
+    """
+    if count == 1:
+        grade_report(evaluation_report)
+        return
+
+    for report in _split_batch_evaluation_report(evaluation_report, count):
+        grade_report(report)
+
+
 def evaluate_scenario(
     criteria: Criteria,
     output: str,
     execute_prompt: Callable[[str], str],
+    parallel: bool = True,
 ) -> Tuple[str, str]:  # [accuracy, completeness]
     """
     Evaluate a single scenario.
     This function accepts the scenario data and evaluates completeness and accuracy.
+    By default the completeness prompt is executed in a worker thread while
+    the accuracy prompt is executed in the calling thread.
 
     Args:
         criteria (Criteria): Evaluation criteria.
         output (str): Scenario output.
         execute_prompt (Callable[[str], str]): The function to execute the evaluation prompt.
+        parallel (bool): Execute both prompts concurrently. Set to False if
+        execute_prompt is not thread-safe.
 
     Returns:
         Tuple[EvaluationResult, EvaluationResult]: A tuple containing the
         accuracy and completeness evaluation results.
     """
-    completeness_report = evaluate_output(
+    if not parallel:
+        completeness_report = evaluate_output(
+            criteria.evaluation_steps.completeness,
+            output,
+            execute_prompt,
+        )
+
+        accuracy_report = evaluate_output(
+            criteria.evaluation_steps.accuracy, output, execute_prompt
+        )
+
+        return (accuracy_report, completeness_report)
+
+    completeness_future = _executor.submit(
+        evaluate_output,
         criteria.evaluation_steps.completeness,
         output,
         execute_prompt,
     )
 
-    accuracy_report = evaluate_output(
-        criteria.evaluation_steps.accuracy, output, execute_prompt
+    try:
+        accuracy_report = evaluate_output(
+            criteria.evaluation_steps.accuracy, output, execute_prompt
+        )
+    except Exception:
+        # Wait for the worker without raising its exception, so no request
+        # outlives the call and the first exception is propagated
+        completeness_future.exception()
+        raise
+    except BaseException:
+        # KeyboardInterrupt or SystemExit must not wait for the request,
+        # only a request that has not started yet is cancelled
+        completeness_future.cancel()
+        raise
+
+    completeness_report = completeness_future.result()
+
+    return (accuracy_report, completeness_report)
+
+
+async def aevaluate_scenario(
+    criteria: Criteria,
+    output: str,
+    execute_prompt: Callable[[str], Awaitable[str]],
+) -> Tuple[str, str]:  # [accuracy, completeness]
+    """
+    Evaluate a single scenario asynchronously.
+    Completeness and accuracy are evaluated concurrently, so the scenario
+    takes one LLM round trip instead of two.
+
+    Args:
+        criteria (Criteria): Evaluation criteria.
+        output (str): Scenario output.
+        execute_prompt (Callable[[str], Awaitable[str]]): The coroutine function to execute the evaluation prompt.
+
+    Returns:
+        Tuple[str, str]: A tuple containing the accuracy and completeness
+        evaluation reports.
+    """
+    (completeness_report, accuracy_report) = await asyncio.gather(
+        aevaluate_output(
+            criteria.evaluation_steps.completeness,
+            output,
+            execute_prompt,
+        ),
+        aevaluate_output(
+            criteria.evaluation_steps.accuracy, output, execute_prompt
+        ),
     )
 
     return (accuracy_report, completeness_report)
 
 
+async def aevaluate_scenarios_batch(
+    scenarios: List[Tuple[Criteria, str]],
+    execute_prompt: Callable[[str], Awaitable[str]],
+) -> List[Tuple[str, str]]:  # [(accuracy, completeness), ...]
+    """
+    Evaluate several scenarios asynchronously with one prompt per metric.
+    Completeness and accuracy of all scenarios are evaluated with two
+    concurrent requests.
+
+    Args:
+        scenarios (List[Tuple[Criteria, str]]): Pairs of evaluation criteria
+        and scenario output.
+        execute_prompt (Callable[[str], Awaitable[str]]): The coroutine function to execute the evaluation prompt.
+
+    Returns:
+        List[Tuple[str, str]]: Accuracy and completeness evaluation reports
+        of each scenario, in the same order.
+    """
+    (completeness_reports, accuracy_reports) = await asyncio.gather(
+        aevaluate_outputs_batch(
+            [
+                (criteria.evaluation_steps.completeness, output)
+                for (criteria, output) in scenarios
+            ],
+            execute_prompt,
+        ),
+        aevaluate_outputs_batch(
+            [
+                (criteria.evaluation_steps.accuracy, output)
+                for (criteria, output) in scenarios
+            ],
+            execute_prompt,
+        ),
+    )
+
+    return list(zip(accuracy_reports, completeness_reports))
+
+
 def grade_scenario(
     accuracy_report: str, completeness_report: str
 ) -> Tuple[GradingResult, GradingResult]:
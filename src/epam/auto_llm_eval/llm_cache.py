@@ -0,0 +1,192 @@
+"""This module provides a persistent exact-match cache for LLM responses"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Self
+
+
+logger = logging.getLogger(__name__)
+
+
+def hash_prompt(model_id: str, prompt: str) -> str:
+    """
+    Compute the cache key of a prompt sent to the given model.
+
+    The model identifier is part of the key, so responses of different
+    models or model versions never collide.
+
+    Args:
+        model_id (str): Identifier of the model, including its version.
+        prompt (str): The prompt sent to the model.
+
+    Returns:
+        str: SHA-256 hex digest of the model identifier and the prompt.
+    """
+    digest = hashlib.sha256()
+    digest.update(model_id.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+class LLMCache:
+    """
+    Cache of LLM responses stored in a SQLite database.
+
+    Each response is stored in its own row, so adding a response never
+    rewrites the whole cache.
+    """
+
+    ttl: float | None
+    refresh: bool
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        ttl: float | None = None,
+        refresh: bool = False,
+    ):
+        """
+        Open the cache database, creating it if necessary.
+
+        Args:
+            db_path (str | Path): Path to the SQLite database file.
+            ttl (float | None): Number of seconds a response stays fresh.
+            Responses never expire if None.
+            refresh (bool): Ignore the responses stored before the cache was
+            opened. Fresh responses still replace them.
+        """
+        self.ttl = ttl
+        self.refresh = refresh
+        self._opened_at = time.time()
+        self._pending: dict[str, asyncio.Future[str]] = {}
+        self._connection = sqlite3.connect(db_path)
+        # Write-ahead logging makes each put an append instead of a rewrite
+        # of the database pages
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "value BLOB NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, key: str) -> str | None:
+        """
+        Get the cached response for the given key.
+
+        Args:
+            key (str): The cache key, see `hash_prompt`.
+
+        Returns:
+            str | None: The cached response, or None if it is missing or
+            expired.
+        """
+        row = self._connection.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        (value, created_at) = row
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            return None
+
+        if self.refresh and created_at < self._opened_at:
+            return None
+
+        return value.decode("utf-8")
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Store the response for the given key, replacing any previous one.
+
+        Args:
+            key (str): The cache key, see `hash_prompt`.
+            value (str): The response to store.
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at) "
+            "VALUES (?, ?, ?)",
+            (key, value.encode("utf-8"), time.time()),
+        )
+        self._connection.commit()
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[str]],
+        validate: Callable[[str], None] | None = None,
+    ) -> str:
+        """
+        Get the cached response, or await the call and cache its result.
+
+        Concurrent calls with the same key share a single call, so identical
+        prompts issued at the same time reach the LLM only once.
+
+        Args:
+            key (str): The cache key, see `hash_prompt`.
+            call (Callable[[], Awaitable[str]]): Coroutine function producing
+            the response on a cache miss.
+            validate (Callable[[str], None] | None): Function checking the
+            produced response, raising TypeError or ValueError if it is
+            invalid. Invalid responses are returned but not cached, so they
+            are requested again next time.
+
+        Returns:
+            str: The cached or freshly produced response.
+        """
+        value = self.get(key)
+        if value is not None:
+            logger.debug("LLM cache hit: %s", key)
+            return value
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._call_and_put(key, call, validate)
+            )
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        else:
+            logger.debug("LLM request already in flight: %s", key)
+
+        # Shield the shared call, so a cancelled caller does not cancel it for
+        # the other callers
+        return await asyncio.shield(pending)
+
+    async def _call_and_put(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[str]],
+        validate: Callable[[str], None] | None,
+    ) -> str:
+        """Await the call and cache its result if it is valid."""
+        value = await call()
+        if validate is not None:
+            try:
+                validate(value)
+            except (TypeError, ValueError) as e:
+                logger.warning("LLM response not cached: %s", e)
+                return value
+
+        self.put(key, value)
+
+        return value
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._connection.close()
@@ -0,0 +1,160 @@
+"""This module provides rate limiting for asynchronous LLM clients"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from typing import Any, Callable, Tuple, Type
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitedRunnable:
+    """
+    Wrapper limiting the concurrency and the request rate of a model.
+
+    The wrapped object must provide an `ainvoke` coroutine method, as
+    LangChain runnables do. Requests wait for a free concurrency slot and
+    for a token of the token bucket, and are retried with exponential
+    backoff when they fail with one of the retryable exceptions. A delay
+    requested by the server with the Retry-After header of the failed
+    response takes precedence over the backoff.
+    """
+
+    runnable: Any
+    retry_on: Tuple[Type[BaseException], ...]
+    retry_if: Callable[[BaseException], bool] | None
+    max_retries: int
+    max_backoff: float
+
+    def __init__(
+        self,
+        runnable: Any,
+        max_concurrency: int = 10,
+        requests_per_minute: float | None = None,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+        retry_if: Callable[[BaseException], bool] | None = None,
+        max_retries: int = 5,
+        max_backoff: float = 60.0,
+    ):
+        """
+        Initialize a RateLimitedRunnable instance.
+
+        Args:
+            runnable (Any): The object to wrap, providing `ainvoke`.
+            max_concurrency (int): Maximum number of requests in flight.
+            requests_per_minute (float | None): Maximum request rate. The
+            rate is not limited if None.
+            retry_on (Tuple[Type[BaseException], ...]): Exceptions that
+            trigger a retry, e.g. the client's rate limit error.
+            retry_if (Callable[[BaseException], bool] | None): Check of a
+            caught retryable exception, e.g. of its status code. All of them
+            are retried if None.
+            max_retries (int): Maximum number of retries of a request.
+            max_backoff (float): Maximum delay between retries in seconds.
+        """
+        self.runnable = runnable
+        self.retry_on = retry_on
+        self.retry_if = retry_if
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate = requests_per_minute / 60 if requests_per_minute else 0
+        # Allow bursts of up to max_concurrency requests
+        self._capacity = float(max_concurrency)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        """
+        Invoke the wrapped runnable respecting the limits.
+
+        All arguments are passed to the `ainvoke` method of the wrapped
+        runnable.
+
+        Returns:
+            Any: The result of the wrapped runnable.
+
+        Raises:
+            BaseException: The last retryable exception once the retries
+            are exhausted, or any other exception right away.
+        """
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                await self._acquire_token()
+                try:
+                    return await self.runnable.ainvoke(*args, **kwargs)
+                except self.retry_on as e:
+                    if attempt >= self.max_retries or (
+                        self.retry_if is not None and not self.retry_if(e)
+                    ):
+                        raise
+
+                    delay = _get_retry_after(e)
+                    if delay is None or not 0 <= delay <= self.max_backoff:
+                        delay = min(
+                            2**attempt + random.uniform(0, 1),
+                            self.max_backoff,
+                        )
+                    logger.warning(
+                        "Request failed: %s. Retrying in %.1f seconds",
+                        e,
+                        delay,
+                    )
+
+            # Back off outside the semaphore to let other requests proceed
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _acquire_token(self) -> None:
+        """Wait until the token bucket allows another request."""
+        if not self._rate:
+            return
+
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated_at) * self._rate,
+            )
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+def _get_retry_after(error: BaseException) -> float | None:
+    """Get the delay in seconds requested by the server, if any."""
+    # HTTP client errors, e.g. the OpenAI ones, carry the failed response
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+
+    try:
+        return float(headers["retry-after-ms"]) / 1000
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+
+    # The header may also be an HTTP date
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    return retry_at.timestamp() - time.time()
@@ -0,0 +1,105 @@
+"""Tests of the evaluation script"""
+
+import json
+import unittest
+
+from evaluate import extract_json_from_md, validate_reply
+
+REPORT = {
+    "evaluation_steps": [
+        {
+            "criterion": "Verify the function has a docstring",
+            "weight": 0.5,
+            "passed": True,
+            "confidence": 100,
+            "explanation": "The function has a docstring.",
+        }
+    ]
+}
+
+# Explanations often quote code, so the report itself contains fences
+REPORT_WITH_CODE = {
+    "evaluation_steps": [
+        {
+            "criterion": "Verify the code uses a context manager",
+            "weight": 1.0,
+            "passed": False,
+            "confidence": 100,
+            "explanation": "The file is opened with:\n```python\n"
+            "f = open(path)\n```\nand never closed.",
+        }
+    ]
+}
+
+
+class ExtractJsonFromMdTest(unittest.TestCase):
+    def test_fenced_json(self):
+        content = f"```json\n{json.dumps(REPORT, indent=2)}\n```\n"
+
+        self.assertEqual(json.loads(extract_json_from_md(content)), REPORT)
+
+    def test_fenced_json_without_language(self):
+        content = f"```\n{json.dumps(REPORT)}\n```"
+
+        self.assertEqual(json.loads(extract_json_from_md(content)), REPORT)
+
+    def test_plain_json(self):
+        content = f"\n{json.dumps(REPORT, indent=2)}\n"
+
+        self.assertEqual(json.loads(extract_json_from_md(content)), REPORT)
+
+    def test_fences_inside_fenced_json_are_kept(self):
+        content = f"```json\n{json.dumps(REPORT_WITH_CODE, indent=2)}\n```"
+
+        self.assertEqual(
+            json.loads(extract_json_from_md(content)), REPORT_WITH_CODE
+        )
+
+    def test_fences_inside_plain_json_are_kept(self):
+        content = json.dumps(REPORT_WITH_CODE, indent=2)
+
+        self.assertEqual(
+            json.loads(extract_json_from_md(content)), REPORT_WITH_CODE
+        )
+
+    def test_fenced_json_followed_by_prose_is_kept(self):
+        # Not wrapped by the code block as a whole, so it is left to fail
+        # grading instead of guessing which part is the report
+        content = f"```json\n{json.dumps(REPORT)}\n```\nHope this helps!"
+
+        self.assertEqual(extract_json_from_md(content), content)
+
+    def test_bare_fences_are_kept(self):
+        for content in ["```", "````", "`````"]:
+            with self.subTest(content=content):
+                self.assertEqual(extract_json_from_md(content), content)
+
+
+class ValidateReplyTest(unittest.TestCase):
+    def test_single_report(self):
+        validate_reply(f"```json\n{json.dumps(REPORT)}\n```")
+
+    def test_batch_report(self):
+        reply = json.dumps({"reports": [REPORT, REPORT, REPORT]})
+
+        validate_reply(reply, answers=3)
+
+    def test_refusal_is_rejected(self):
+        with self.assertRaises(TypeError):
+            validate_reply("Sorry, I cannot do that")
+
+    def test_batch_report_with_wrong_count_is_rejected(self):
+        reply = json.dumps({"reports": [REPORT, REPORT]})
+
+        with self.assertRaises(TypeError):
+            validate_reply(reply, answers=3)
+
+    def test_batch_report_for_single_answer_is_rejected(self):
+        reply = json.dumps({"reports": [REPORT]})
+
+        with self.assertRaises(TypeError):
+            validate_reply(reply)
+
+
+if __name__ == "__main__":
+    unittest.main()
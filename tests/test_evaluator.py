@@ -0,0 +1,116 @@
+"""Tests of the batch evaluation of several answers"""
+
+import asyncio
+import json
+import unittest
+
+from epam.auto_llm_eval import (
+    aevaluate_outputs_batch,
+    evaluate_outputs_batch,
+    grade_report,
+    validate_evaluation_report,
+    CriterionEvalStep,
+)
+
+REPORTS = [
+    {
+        "evaluation_steps": [
+            {
+                "criterion": "Verify the answer is written in Python",
+                "weight": 1.0,
+                "passed": True,
+                "confidence": 100,
+                "explanation": "The answer is Python code.",
+            }
+        ]
+    },
+    {
+        "evaluation_steps": [
+            {
+                "criterion": "Verify the answer has type hints",
+                "weight": 0.5,
+                "passed": False,
+                "confidence": 100,
+                "explanation": "The answer has no type hints.",
+            }
+        ]
+    },
+]
+
+ITEMS = [
+    ([CriterionEvalStep("Verify the answer is written in Python", 1.0)], "a"),
+    ([CriterionEvalStep("Verify the answer has type hints", 0.5)], "b"),
+]
+
+
+class EvaluateOutputsBatchTest(unittest.TestCase):
+    def test_reports_are_split_in_order(self):
+        prompts = []
+
+        def execute_prompt(prompt: str) -> str:
+            prompts.append(prompt)
+            return json.dumps({"reports": REPORTS})
+
+        reports = evaluate_outputs_batch(ITEMS, execute_prompt)
+
+        self.assertEqual(len(prompts), 1)
+        self.assertIn("ANSWER 1:\n\na", prompts[0])
+        self.assertIn("ANSWER 2:\n\nb", prompts[0])
+        self.assertEqual([json.loads(report) for report in reports], REPORTS)
+        self.assertEqual(grade_report(reports[0]).get_score(), 1.0)
+        self.assertEqual(grade_report(reports[1]).get_score(), 0.0)
+
+    def test_single_item_uses_regular_prompt(self):
+        prompts = []
+
+        async def execute_prompt(prompt: str) -> str:
+            prompts.append(prompt)
+            return json.dumps(REPORTS[0])
+
+        reports = asyncio.run(
+            aevaluate_outputs_batch(ITEMS[:1], execute_prompt)
+        )
+
+        self.assertEqual(reports, [json.dumps(REPORTS[0])])
+        self.assertNotIn("ANSWER 1:", prompts[0])
+
+    def test_wrong_report_count_is_rejected(self):
+        async def execute_prompt(prompt: str) -> str:
+            return json.dumps({"reports": REPORTS[:1]})
+
+        with self.assertRaisesRegex(TypeError, "expected 2 reports"):
+            asyncio.run(aevaluate_outputs_batch(ITEMS, execute_prompt))
+
+    def test_missing_reports_are_rejected(self):
+        for report in ["Sorry, I cannot do that", "[]", '{"reports": {}}']:
+            with self.subTest(report=report):
+                with self.assertRaises(TypeError):
+                    evaluate_outputs_batch(ITEMS, lambda prompt: report)
+
+    def test_empty_evaluation_steps_are_rejected(self):
+        with self.assertRaises(ValueError):
+            evaluate_outputs_batch([([], "a"), ([], "b")], lambda prompt: "")
+
+
+class ValidateEvaluationReportTest(unittest.TestCase):
+    def test_valid_reports(self):
+        validate_evaluation_report(json.dumps(REPORTS[0]))
+        validate_evaluation_report(json.dumps({"reports": REPORTS}), 2)
+
+    def test_wrong_report_count_is_rejected(self):
+        with self.assertRaises(TypeError):
+            validate_evaluation_report(json.dumps({"reports": REPORTS}), 3)
+
+    def test_invalid_report_in_batch_is_rejected(self):
+        report = json.dumps({"reports": [REPORTS[0], {"steps": []}]})
+
+        with self.assertRaises(TypeError):
+            validate_evaluation_report(report, 2)
+
+    def test_batch_report_for_single_answer_is_rejected(self):
+        with self.assertRaises(TypeError):
+            validate_evaluation_report(json.dumps({"reports": REPORTS[:1]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Tests of the LLM response cache"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from epam.auto_llm_eval import LLMCache, hash_prompt
+
+
+def reject_sorry(value: str) -> None:
+    if value.startswith("Sorry"):
+        raise TypeError("Invalid evaluation report")
+
+
+class LLMCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db_path = os.path.join(directory.name, "llm_cache.sqlite")
+
+    def open_cache(self, **kwargs) -> LLMCache:
+        cache = LLMCache(self.db_path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_hash_prompt_depends_on_model(self):
+        self.assertNotEqual(
+            hash_prompt("o3-mini", "prompt"), hash_prompt("gpt-4o", "prompt")
+        )
+
+    def test_put_and_get(self):
+        cache = self.open_cache()
+        cache.put("key", "value")
+
+        self.assertEqual(cache.get("key"), "value")
+        self.assertIsNone(cache.get("missing"))
+
+    def test_responses_persist(self):
+        with LLMCache(self.db_path) as cache:
+            cache.put("key", "value")
+
+        self.assertEqual(self.open_cache().get("key"), "value")
+
+    def test_expired_response_is_ignored(self):
+        cache = self.open_cache(ttl=60)
+        with mock.patch("time.time", return_value=1000.0):
+            cache.put("key", "value")
+
+        with mock.patch("time.time", return_value=1059.0):
+            self.assertEqual(cache.get("key"), "value")
+        with mock.patch("time.time", return_value=1061.0):
+            self.assertIsNone(cache.get("key"))
+
+    def test_refresh_ignores_older_responses(self):
+        with LLMCache(self.db_path) as cache:
+            with mock.patch("time.time", return_value=1000.0):
+                cache.put("key", "old")
+
+        cache = self.open_cache(refresh=True)
+        self.assertIsNone(cache.get("key"))
+
+        cache.put("key", "new")
+        self.assertEqual(cache.get("key"), "new")
+
+    def test_concurrent_calls_share_one_call(self):
+        cache = self.open_cache()
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run() -> list[str]:
+            return await asyncio.gather(
+                *(cache.get_or_call("key", call) for _ in range(5))
+            )
+
+        self.assertEqual(asyncio.run(run()), ["value"] * 5)
+        self.assertEqual(calls, 1)
+        self.assertEqual(cache.get("key"), "value")
+
+    def test_cancelled_caller_does_not_cancel_shared_call(self):
+        cache = self.open_cache()
+
+        async def call() -> str:
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run() -> str:
+            first = asyncio.ensure_future(cache.get_or_call("key", call))
+            second = asyncio.ensure_future(cache.get_or_call("key", call))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(run()), "value")
+
+    def test_cached_response_skips_call(self):
+        cache = self.open_cache()
+        cache.put("key", "value")
+
+        async def call() -> str:
+            raise AssertionError("The cached response must be used")
+
+        self.assertEqual(asyncio.run(cache.get_or_call("key", call)), "value")
+
+    def test_invalid_response_is_not_cached(self):
+        cache = self.open_cache()
+        replies = iter(["Sorry, I cannot do that", "{}"])
+
+        async def call() -> str:
+            return next(replies)
+
+        with self.assertLogs("epam.auto_llm_eval.llm_cache", "WARNING"):
+            value = asyncio.run(cache.get_or_call("key", call, reject_sorry))
+        self.assertEqual(value, "Sorry, I cannot do that")
+        self.assertIsNone(cache.get("key"))
+
+        value = asyncio.run(cache.get_or_call("key", call, reject_sorry))
+        self.assertEqual(value, "{}")
+        self.assertEqual(cache.get("key"), "{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+"""Tests of the rate limiting of LLM requests"""
+
+import asyncio
+import email.utils
+import unittest
+from unittest import mock
+
+from epam.auto_llm_eval import RateLimitedRunnable
+from epam.auto_llm_eval.rate_limit import _get_retry_after
+
+
+class FakeResponse:
+    def __init__(self, headers: dict):
+        self.headers = headers
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = FakeResponse(headers or {})
+
+
+class FakeModel:
+    """Model failing with the given errors before it succeeds."""
+
+    def __init__(self, *errors: BaseException):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def ainvoke(self, prompt: str) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return f"reply to {prompt}"
+
+
+class FakeClock:
+    """Monotonic clock advanced only by the patched asyncio.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def is_retryable(error: BaseException) -> bool:
+    return error.status_code == 429 or error.status_code >= 500
+
+
+class RateLimitedRunnableTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        for target, new in [
+            ("time.monotonic", self.clock.monotonic),
+            ("asyncio.sleep", self.clock.sleep),
+            ("random.uniform", lambda a, b: 0.0),
+        ]:
+            patcher = mock.patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_retries_rate_limit_error(self):
+        model = FakeModel(FakeStatusError(429))
+        runnable = RateLimitedRunnable(model, retry_on=(FakeStatusError,))
+
+        with self.assertLogs("epam.auto_llm_eval.rate_limit", "WARNING"):
+            reply = asyncio.run(runnable.ainvoke("prompt"))
+
+        self.assertEqual(reply, "reply to prompt")
+        self.assertEqual(model.calls, 2)
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_backoff_is_exponential_and_limited(self):
+        model = FakeModel(*(FakeStatusError(500) for _ in range(4)))
+        runnable = RateLimitedRunnable(
+            model, retry_on=(FakeStatusError,), max_backoff=5.0
+        )
+
+        with self.assertLogs("epam.auto_llm_eval.rate_limit", "WARNING"):
+            asyncio.run(runnable.ainvoke("prompt"))
+
+        self.assertEqual(self.clock.sleeps, [1.0, 2.0, 4.0, 5.0])
+
+    def test_retry_after_header_sets_delay(self):
+        model = FakeModel(
+            FakeStatusError(429, {"retry-after": "7"}),
+            FakeStatusError(429, {"retry-after-ms": "250"}),
+        )
+        runnable = RateLimitedRunnable(model, retry_on=(FakeStatusError,))
+
+        with self.assertLogs("epam.auto_llm_eval.rate_limit", "WARNING"):
+            asyncio.run(runnable.ainvoke("prompt"))
+
+        self.assertEqual(self.clock.sleeps, [7.0, 0.25])
+
+    def test_too_long_retry_after_is_ignored(self):
+        model = FakeModel(FakeStatusError(429, {"retry-after": "3600"}))
+        runnable = RateLimitedRunnable(model, retry_on=(FakeStatusError,))
+
+        with self.assertLogs("epam.auto_llm_eval.rate_limit", "WARNING"):
+            asyncio.run(runnable.ainvoke("prompt"))
+
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_retry_if_filters_errors(self):
+        model = FakeModel(FakeStatusError(400))
+        runnable = RateLimitedRunnable(
+            model, retry_on=(FakeStatusError,), retry_if=is_retryable
+        )
+
+        with self.assertRaises(FakeStatusError):
+            asyncio.run(runnable.ainvoke("prompt"))
+        self.assertEqual(model.calls, 1)
+
+    def test_other_errors_are_not_retried(self):
+        model = FakeModel(ValueError("invalid prompt"))
+        runnable = RateLimitedRunnable(model, retry_on=(FakeStatusError,))
+
+        with self.assertRaises(ValueError):
+            asyncio.run(runnable.ainvoke("prompt"))
+        self.assertEqual(model.calls, 1)
+
+    def test_last_error_is_raised_after_max_retries(self):
+        model = FakeModel(*(FakeStatusError(429) for _ in range(3)))
+        runnable = RateLimitedRunnable(
+            model, retry_on=(FakeStatusError,), max_retries=2
+        )
+
+        with self.assertLogs("epam.auto_llm_eval.rate_limit", "WARNING"):
+            with self.assertRaises(FakeStatusError):
+                asyncio.run(runnable.ainvoke("prompt"))
+        self.assertEqual(model.calls, 3)
+
+    def test_token_bucket_limits_request_rate(self):
+        model = FakeModel()
+        runnable = RateLimitedRunnable(
+            model, max_concurrency=2, requests_per_minute=60
+        )
+
+        async def run() -> None:
+            for _ in range(4):
+                await runnable.ainvoke("prompt")
+
+        asyncio.run(run())
+
+        # A burst of max_concurrency requests, then one request per second
+        self.assertEqual(model.calls, 4)
+        self.assertEqual(self.clock.sleeps, [1.0, 1.0])
+        self.assertEqual(self.clock.now, 2.0)
+
+
+class GetRetryAfterTest(unittest.TestCase):
+    def test_seconds(self):
+        error = FakeStatusError(429, {"retry-after": "2.5"})
+
+        self.assertEqual(_get_retry_after(error), 2.5)
+
+    def test_milliseconds_take_precedence(self):
+        error = FakeStatusError(
+            429, {"retry-after-ms": "1500", "retry-after": "2"}
+        )
+
+        self.assertEqual(_get_retry_after(error), 1.5)
+
+    def test_http_date(self):
+        with mock.patch("time.time", return_value=1_000_000_000.0):
+            date = email.utils.formatdate(1_000_000_010.0, usegmt=True)
+            error = FakeStatusError(429, {"retry-after": date})
+
+            self.assertEqual(_get_retry_after(error), 10.0)
+
+    def test_missing_or_invalid_header(self):
+        for error in [
+            ValueError("no response"),
+            FakeStatusError(429),
+            FakeStatusError(429, {"retry-after": "soon"}),
+        ]:
+            with self.subTest(error=error):
+                self.assertIsNone(_get_retry_after(error))
+
+
+if __name__ == "__main__":
+    unittest.main()